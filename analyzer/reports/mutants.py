@@ -2,6 +2,7 @@ import hashlib
 import xml.etree.ElementTree as ET
 from abc import ABC
 from collections import defaultdict
+from typing import Optional
 
 import pandas as pd
 
@@ -10,6 +11,7 @@ class Mutant(ABC):
     def __init__(self, line: int):
         # assert line >= 0
         self.line = line
+        self._h: Optional[int] = None
 
     def hash_tuple(self) -> tuple:
         return tuple(self.hash_dict().values())
@@ -25,7 +27,11 @@ class Mutant(ABC):
         return h.hexdigest()
 
     def __hash__(self):
-        return int(self.hash_string(), base=16)
+        # cache the value: hash_string digests the whole hash
+        # tuple, way too expensive to redo on every lookup
+        if self._h is None:
+            self._h = int(self.hash_string(), base=16)
+        return self._h
 
     def __eq__(self, other):
         return type(self) is type(other) and hash(self) == hash(other)
@@ -155,6 +161,35 @@ class MajorMutant(MutantWithCounter):
             description=self.description,
         )
 
+    @classmethod
+    def from_tuple(cls, thetuple: tuple) -> "MajorMutant":
+        """Build a mutant from a joined dataframe row as yielded by
+        itertuples(index=True, name=None): MutantNo, Operator, From,
+        To, Signature, LineNumber, LineBuffer, Description, Status"""
+        (
+            _,
+            operator,
+            original,
+            mutated,
+            signature,
+            line,
+            _,
+            description,
+            status,
+        ) = thetuple
+
+        mutant = cls(int(line))
+        mutant.status = status
+        mutant.operator = operator
+        mutant.original = original
+        mutant.mutated = mutated
+        mutant.signature = signature
+        mutant.description = description
+
+        mutant.get_hash_count()
+
+        return mutant
+
     @classmethod
     def from_series(cls, row: pd.Series) -> "MajorMutant":
         line = row.LineNumber
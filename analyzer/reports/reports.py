@@ -1,512 +1,740 @@
-import datetime
-import hashlib
-import json
-import os
-import pathlib
-import re
-import xml.etree.ElementTree as ET
-from abc import ABC
-from collections import Counter
-from typing import List, Optional, Set, Union
-
-import pandas as pd
-from reports.mutants import JudyMutant, JumbleMutant, MajorMutant, Mutant, PitMutant
-
-ERR_EXTRACT = (
-    "An exception was raised when extracting the content of {fp}.\n"
-    "Maybe this is the wrong file for this Report?"
-)
-ERR_EXTRACT_MULT = (
-    "An exception was raised when extracting the contents of {fps}.\n"
-    "Maybe these are the wrong files for this Report?"
-)
-
-
-class ReportError(Exception):
-    """Base report error"""
-
-
-class MultipleClassUnderMutationError(Exception):
-    """Only a class under mutation at time can be analyzed
-    because of Jumble - working on a single class at time"""
-
-
-class MissingMutantCountException(ReportError):
-    """Exception when a mutant list count is missing,
-    This can happen if it's impossible to extract
-    information about that particular kind of
-     mutants from a report"""
-
-
-class OverlappingMutantsError(ReportError):
-    """Exception raised when there are two
-    or more mutants in a sequence that shares the same
-    hash key; because collisions are unlikely with SHA256,
-    this means that the Mutant interface needs a counter"""
-
-
-class JudyReportError(ReportError):
-    """Judy specialized report error"""
-
-
-class EmptyJudyReportError(JudyReportError):
-    """Error raised when a report is empty"""
-
-
-class MissingClassFromJudyReportError(JudyReportError):
-    """Exception when the desired class is
-    missing from a report"""
-
-
-class MultipleClassFromJudyReportError(JudyReportError):
-    """Error when the desired class is found
-    multiple times in a report"""
-
-
-class JumbleReportError(ReportError):
-    """Jumble specialized report error"""
-
-
-class MajorReportError(ReportError):
-    """Major specialized report error"""
-
-
-class PitReportError(ReportError):
-    """Pit specialized report error"""
-
-
-class WrongTagInPitReportError(PitReportError):
-    """Error raised when a non-mutation element is
-    encountered parsing an XML Pit report"""
-
-
-class Report(ABC):
-    class_under_mutation: str
-
-    def __init__(self):
-        self._created_at = datetime.datetime.now()
-
-        self.killed_mutants: Optional[List[Mutant]] = None
-        self.live_mutants: Optional[List[Mutant]] = None
-        self._killed_mutants_count: Optional[int] = None
-        self._live_mutants_count: Optional[int] = None
-
-    def hash_string(self) -> str:
-        """Hash algorithm hex digest
-        converted to string"""
-        raise NotImplementedError
-
-    def __hash__(self) -> int:
-        """hash string value (hex)
-        converted to int, to match
-        Python __hash__ return value"""
-        return int(self.hash_string(), base=16)
-
-    def summary(self, print_mutants: bool = False) -> str:
-        mutscore = self.killed_mutants_count / self.total_mutants_count
-        buffer = [
-            f"{self.__class__.__name__} Summary [Hash: {self.hash_string()}]",
-            f"Report created at:    {self._created_at}",
-            f"Mutated class:        {self.class_under_mutation}",
-            f"Total mutants count:  {self.total_mutants_count}",
-            f"Killed mutants count: {self.killed_mutants_count}",
-            f"Live mutants count:   {self.live_mutants_count}",
-            f"Mutation score:       {mutscore}",
-        ]
-
-        for mutants_arr, mutants_str in zip(
-            [self.killed_mutants, self.live_mutants], ["Killed", "Live"]
-        ):
-            if mutants_arr:
-                buffer.append(f"{mutants_str} mutants report:")
-                if print_mutants:
-                    buffer.append("\n".join(str(m) for m in mutants_arr))
-                else:
-                    buffer.append("< SNIP >")
-            else:
-                buffer.append(f"Cannot report {mutants_str} mutants")
-
-        return "\n".join(buffer)
-
-    @staticmethod
-    def find_overlapping_mutants(mutants: List[Mutant]) -> Set[Mutant]:
-        """This brief algorithm finds the mutants that are duplicates,
-        i.e. their hash value is equal."""
-        counter = Counter([hash(mutant) for mutant in mutants])
-        duplicates = [h for (h, c) in counter.items() if c > 1]
-        return set([m for m in mutants if hash(m) in duplicates])
-
-    def sanity_check(self):
-        """Check for overlapping mutants"""
-        if self.killed_mutants:
-            set_killed = self.find_overlapping_mutants(self.killed_mutants)
-            if set_killed:
-                raise OverlappingMutantsError(set_killed)
-
-        if self.live_mutants:
-            set_live = self.find_overlapping_mutants(self.live_mutants)
-            if set_live:
-                raise OverlappingMutantsError(set_live)
-
-        if not self.class_under_mutation:
-            raise ReportError(
-                "Cannot set class under mutation! Maybe input report was broken?"
-            )
-
-    @property
-    def killed_mutants_count(self) -> int:
-        if self.killed_mutants is not None:
-            return len(self.killed_mutants)
-        elif self._killed_mutants_count is not None:
-            return self._killed_mutants_count
-        else:
-            raise MissingMutantCountException()
-
-    @property
-    def live_mutants_count(self) -> int:
-        if self.live_mutants is not None:
-            return len(self.live_mutants)
-        elif self._live_mutants_count is not None:
-            return self._live_mutants_count
-        else:
-            raise MissingMutantCountException()
-
-    @property
-    def total_mutants_count(self) -> int:
-        return self.killed_mutants_count + self.live_mutants_count
-
-    def __repr__(self):
-        return (
-            f"Report(class_under_mutation={self.class_under_mutation},"
-            f" killed_count={self.killed_mutants_count},"
-            f" live_count={self.live_mutants_count},"
-            f" total_count={self.total_mutants_count})"
-        )
-
-
-class SingleFileReport(Report):
-    def __init__(self, filepath: Union[str, os.PathLike]):
-        super(SingleFileReport, self).__init__()
-
-        self.filepath = pathlib.Path(filepath)
-        content = open(self.filepath, "rb").read()
-        self._hash_string = hashlib.md5(content).hexdigest()
-        try:
-            self.extract()
-        except Exception:
-            raise ReportError(ERR_EXTRACT.format(fp=self.filepath))
-
-        self.sanity_check()
-
-    def hash_string(self):
-        return self._hash_string
-
-    def extract(self, **kwargs):
-        raise NotImplementedError
-
-    def summary(self, print_mutants: bool = False) -> str:
-        summary = super(SingleFileReport, self).summary(print_mutants=print_mutants)
-        fp = str(self.filepath)
-        return f"{summary}\nFilepath: {fp}"
-
-
-class MultipleFilesReport(Report):
-    def __init__(self, *filepaths: Union[str, os.PathLike]):
-        super(MultipleFilesReport, self).__init__()
-
-        self.filepaths = [pathlib.Path(fp) for fp in filepaths]
-        content = b"\n".join(open(fp, "rb").read() for fp in self.filepaths)
-        self._hash_string = hashlib.md5(content).hexdigest()
-        try:
-            self.extract()
-        except Exception:
-            raise ReportError(ERR_EXTRACT_MULT.format(fps=self.filepaths))
-
-        self.sanity_check()
-
-    def hash_string(self):
-        return self._hash_string
-
-    def extract(self, **kwargs):
-        raise NotImplementedError
-
-    def summary(self, print_mutants: bool = False) -> str:
-        summary = super(MultipleFilesReport, self).summary(print_mutants=print_mutants)
-        fps = [str(fp) for fp in self.filepaths]
-        return f"{summary}\nFilepaths: {fps}"
-
-
-class SingleJudyReport(SingleFileReport):
-    def __init__(
-        self,
-        json_filepath: Union[str, os.PathLike],
-        class_under_mutation: str,
-    ):
-        self.class_under_mutation = class_under_mutation
-        self.json_fp = pathlib.Path(json_filepath)
-        super(SingleJudyReport, self).__init__(json_filepath)
-
-    def __repr__(self):
-        return "SingleJudy" + super(SingleJudyReport, self).__repr__()
-
-    def _extract_json(self):
-        """Parse live mutants from json report"""
-        judy_dict = json.loads(open(self.json_fp).read())
-
-        classes = judy_dict["classes"]
-        if not classes:
-            raise EmptyJudyReportError(
-                "No mutated class found! There were some errors in execution phase"
-            )
-
-        thedict = [
-            adict for adict in classes if adict["name"] == self.class_under_mutation
-        ]
-
-        if len(thedict) == 0:
-            raise MissingClassFromJudyReportError(
-                f"{self.class_under_mutation} not found!"
-            )
-        elif len(thedict) > 1:
-            raise MultipleClassFromJudyReportError(
-                f"{self.class_under_mutation} found multiple times!"
-            )
-        else:
-            thedict = thedict[0]
-
-        JudyMutant.reset_counter()
-        self._killed_mutants_count = thedict["mutantsKilledCount"]
-        self.live_mutants = [
-            JudyMutant.from_dict(mdict) for mdict in thedict["notKilledMutant"]
-        ]
-
-    def extract(self):
-        self._extract_json()
-
-
-class MultipleJudyReport(MultipleFilesReport):
-    def __init__(
-        self,
-        json_filepath: Union[str, os.PathLike],
-        log_filepath: Union[str, os.PathLike],
-        class_under_mutation: str,
-    ):
-        self.class_under_mutation = class_under_mutation
-        self.json_fp = pathlib.Path(json_filepath)
-        self.log_fp = pathlib.Path(log_filepath)
-        super(MultipleJudyReport, self).__init__(json_filepath, log_filepath)
-
-    def __repr__(self):
-        return "MultipleJudy" + super(MultipleJudyReport, self).__repr__()
-
-    def _extract_json(self):
-        """Parse live mutants from json report"""
-        judy_dict = json.loads(open(self.json_fp).read())
-
-        classes = judy_dict["classes"]
-        if not classes:
-            raise EmptyJudyReportError(
-                "No mutated class found! There were some errors in execution phase"
-            )
-
-        thedict = [
-            adict for adict in classes if adict["name"] == self.class_under_mutation
-        ]
-
-        if len(thedict) == 0:
-            raise MissingClassFromJudyReportError(
-                f"{self.class_under_mutation} not found!"
-            )
-        elif len(thedict) > 1:
-            raise MultipleClassFromJudyReportError(
-                f"{self.class_under_mutation} found multiple times!"
-            )
-        else:
-            thedict = thedict[0]
-
-        JudyMutant.reset_counter()
-        self._killed_mutants_count = thedict["mutantsKilledCount"]
-        self.live_mutants = [
-            JudyMutant.from_dict(mdict) for mdict in thedict["notKilledMutant"]
-        ]
-
-    def _extract_log(self):
-        """Extract killed mutants through log"""
-        lines = open(self.log_fp).readlines()
-        regexp = (
-            r"DEBUG\s+pl\.edu\.pwr\.judy\.research\.fragility\.ResearchDataCollector"
-            r"\s+-?\s*\s+[\w\.]+\s*(\d+)\s*(\d+)\s*(\w+)\s*\[?([^\]]+)\]?\s*([\w\.]+)"
-        )
-        pattern = re.compile(regexp)
-        mutations = set()
-
-        for line in lines:
-            match = pattern.search(line)
-            if not match:
-                continue
-            points = match.group(1)
-            mutant_id = match.group(2)
-            operator = match.group(3)
-            line = match.group(4)
-            # killed_test = match.group(5)
-
-            # adding in a set will result in collision removal
-            entry = (points, mutant_id, operator, line)
-            mutations.add(entry)
-
-        self.killed_mutants = [JudyMutant.from_tuple(t) for t in mutations]
-
-    def extract(self):
-        self._extract_json()
-        self._extract_log()
-
-
-class JumbleReport(SingleFileReport):
-    def __repr__(self):
-        return "Jumble" + super(JumbleReport, self).__repr__()
-
-    def extract(self):
-        content = open(self.filepath).read()
-
-        class_pattern = re.compile(r"Mutating (.+)")
-        self.class_under_mutation = class_pattern.search(content).group(1)
-
-        fail_pattern = re.compile(r"M FAIL:\s*([a-zA-Z.]+):(\d+):\s*(.+)")
-        start_pattern = re.compile(
-            r"Mutation points = \d+, unit test time limit \d+\.\d+s"
-        )
-        end_pattern = re.compile(r"Jumbling took \d+\.\d+s")
-        error_pattern = re.compile(r"Score: \d+%\s*\(?([\w ]+)?")
-
-        # check if there were some errors with Jumble
-        errmsg = error_pattern.search(content).group(1)
-        if errmsg:
-            raise JumbleReportError(errmsg)
-
-        i = start_pattern.search(content).end()
-        j = end_pattern.search(content[i:]).start() + i
-
-        # this is the actual text regarding mutations
-        text = content[i:j]
-
-        # subtract from text all the fails + get count of them
-        killed_text, live_mutants_count = fail_pattern.subn("", text)
-        killed_mutants_count = len(re.sub(r"\s+", "", killed_text))
-
-        JumbleMutant.reset_counter()
-        self._killed_mutants_count = killed_mutants_count
-        self.live_mutants = [
-            JumbleMutant.from_tuple(atuple) for atuple in fail_pattern.findall(text)
-        ]
-        assert self.live_mutants_count == live_mutants_count
-
-
-class MajorReport(MultipleFilesReport):
-    def __init__(
-        self,
-        mutation_log_fp: Union[str, os.PathLike],
-        kill_csv_fp: Union[str, os.PathLike],
-    ):
-        self.mutation_log_fp = mutation_log_fp
-        self.kill_csv_fp = kill_csv_fp
-        super(MajorReport, self).__init__(mutation_log_fp, kill_csv_fp)
-
-    def __repr__(self):
-        return "Major" + super(MajorReport, self).__repr__()
-
-    def extract(self):
-        if len(self.filepaths) != 2:
-            raise MajorReportError(
-                "Two files must be provided! kill.csv and mutants.log"
-            )
-
-        logfile, csvfile = self.mutation_log_fp, self.kill_csv_fp
-
-        columns = ["MutantNo", "Status"]
-        kill_df = pd.read_csv(csvfile, header=0, names=columns).set_index(columns[0])
-
-        columns = [
-            "MutantNo",
-            "Operator",
-            "From",
-            "To",
-            "Signature",
-            "LineNumber",
-            "LineBuffer",
-            "Description",
-        ]
-        mutants_df = pd.read_csv(
-            logfile, delimiter=":", header=None, names=columns, on_bad_lines='skip'
-        ).set_index(columns[0])
-
-        # fix mismatch in length
-        if kill_df.empty or len(kill_df) == 0:
-            # empty kill csv -> all mutants are live
-            kill_df = pd.DataFrame(["LIVE"] * len(mutants_df), columns=["Status"])
-            kill_df.index.name = "MutantNo"
-
-        print(f"Kill dataframe:\n{kill_df}")
-        print(f"Mutants dataframe:\n{mutants_df}")
-
-        df = mutants_df.join(kill_df)
-        print(f"Mutants dataframe:\n{df}")
-        live_mutants = df.loc[df.Status == "LIVE"]
-        print(f"Live mutants dataframe:\n{live_mutants}")
-        killed_mutants = df.loc[df.index.difference(live_mutants.index)]
-        print(f"Killed mutants dataframe:\n{killed_mutants}")
-        live_count = len(live_mutants)
-        print(f"Live mutants count: {live_count}")
-        killed_count = len(killed_mutants)
-        print(f"Killed mutants count: {killed_count}")
-        assert len(df) == live_count + killed_count
-
-        MajorMutant.reset_counter()
-        self.live_mutants = []
-        self.killed_mutants = []
-        classes = []
-
-        for index, row in df.iterrows():
-            mutant = MajorMutant.from_series(row)
-            cls = mutant.signature.split("@")[0]  # get the left part of class@method
-            cls = cls.split("$")[0]  # get the left part of class$subclass
-            classes.append(cls)
-            if mutant.status == "LIVE":
-                self.live_mutants.append(mutant)
-            else:
-                self.killed_mutants.append(mutant)
-
-        if len(set(classes)) > 1:
-            raise MultipleClassUnderMutationError("Multiple classes mutated!")
-        else:
-            self.class_under_mutation = set(classes).pop()
-
-
-class PitReport(SingleFileReport):
-    def __repr__(self):
-        return "Pit" + super(PitReport, self).__repr__()
-
-    def extract(self):
-        tree = ET.parse(self.filepath)
-        root = tree.getroot()
-        elements: List[ET.Element] = list(root)
-
-        self.live_mutants = []
-        self.killed_mutants = []
-        classes = []
-
-        for element in elements:
-            if element.tag != "mutation":
-                msg = f"Expecting 'mutation' element, got {element.tag}"
-                raise WrongTagInPitReportError(msg)
-
-            mutant = PitMutant.from_xml_element(element)
-            classes.append(mutant.mutated_class)
-            if mutant.detected:
-                self.killed_mutants.append(mutant)
-            else:
-                self.live_mutants.append(mutant)
-
-        if len(set(classes)) > 1:
-            raise MultipleClassUnderMutationError("Multiple classes mutated!")
-        else:
-            self.class_under_mutation = set(classes).pop()
+import datetime
+import functools
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import re
+import sys
+import xml.etree.ElementTree as ET
+from abc import ABC
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Union
+
+import pandas as pd
+from reports.mutants import JudyMutant, JumbleMutant, MajorMutant, Mutant, PitMutant
+
+ERR_EXTRACT = (
+    "An exception was raised when extracting the content of {fp}.\n"
+    "Maybe this is the wrong file for this Report?"
+)
+ERR_EXTRACT_MULT = (
+    "An exception was raised when extracting the contents of {fps}.\n"
+    "Maybe these are the wrong files for this Report?"
+)
+
+
+# patterns compiled once per process instead of per extract call
+_JUMBLE_CLASS_RE = re.compile(r"Mutating (.+)")
+_JUMBLE_FAIL_RE = re.compile(r"M FAIL:\s*([a-zA-Z.]+):(\d+):\s*(.+)")
+_JUMBLE_START_RE = re.compile(r"Mutation points = \d+, unit test time limit \d+\.\d+s")
+_JUMBLE_END_RE = re.compile(r"Jumbling took \d+\.\d+s")
+_JUMBLE_ERROR_RE = re.compile(r"Score: \d+%\s*\(?([\w ]+)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=None)
+def _make_judy_log_parser(class_name: str):
+    """Generate a Judy log parser specialized for one class under
+    mutation. The class name is baked into the pattern as a literal,
+    so lines about anything else fail the match immediately, and the
+    scan loop itself is generated and compiled once per class; batch
+    runs re-parsing the same class get the cached parser back.
+
+    The pattern stays anchored and free of overlapping quantifiers
+    (\\s*\\s+, \\]? after [^\\]]+ ...) so matching is linear even on
+    ill-formed lines. Safe since class_name is trusted caller input"""
+    pattern = re.compile(
+        r"DEBUG\s+pl\.edu\.pwr\.judy\.research\.fragility\.ResearchDataCollector"
+        r"\s+-?\s+" + re.escape(class_name) +
+        r"\s+(\d+)\s+(\d+)\s+(\S+)\s+\[([^\]]*)\]\s+(\S+)"
+    )
+    source = (
+        "def parse(lines):\n"
+        "    match_line = _pattern.match\n"
+        "    return {\n"
+        "        (match.group(1), match.group(2), match.group(3), match.group(4))\n"
+        "        for line in lines\n"
+        "        if line.startswith('DEBUG')\n"
+        "        for match in (match_line(line),)\n"
+        "        if match\n"
+        "    }\n"
+    )
+    namespace = {"_pattern": pattern}
+    exec(source, namespace)
+    return namespace["parse"]
+
+# lxml parses at libxml2 speed and can filter tags at C level;
+# PitReport falls back to the stdlib parser when it is missing
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# orjson parses JSON several times faster than the stdlib and
+# consumes bytes directly, skipping the text decode in Python
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# optional numba kernel for duplicate detection: a JIT-compiled
+# counting loop over a uint64 hash array beats the Python Counter
+# on reports with thousands of mutants; silently skipped otherwise
+try:
+    import numpy as np
+    from numba import njit, types
+    from numba.typed import Dict as NumbaDict
+
+    @njit(cache=True)
+    def _find_duplicate_mask(hashes):
+        counts = NumbaDict.empty(types.uint64, types.int64)
+        for h in hashes:
+            if h in counts:
+                counts[h] += 1
+            else:
+                counts[h] = 1
+
+        mask = np.zeros(hashes.shape[0], dtype=np.bool_)
+        for i in range(hashes.shape[0]):
+            mask[i] = counts[hashes[i]] > 1
+        return mask
+
+except ImportError:
+    _find_duplicate_mask = None
+
+# the report hash only identifies a report (__hash__, summary),
+# there is no cryptographic requirement: prefer xxhash, which is
+# an order of magnitude faster than md5, when it is available
+try:
+    import xxhash
+
+    _new_hasher = xxhash.xxh3_64
+except ImportError:
+    _new_hasher = hashlib.md5
+
+# read size for file hashing; 1MB keeps syscall and loop
+# overhead negligible, with diminishing returns beyond that
+_HASH_CHUNK = 1 << 20
+
+
+def _update_hash_from_file(
+    hasher, filepath: Union[str, os.PathLike]
+) -> None:
+    """Feed the content of a file to a hasher without copying it
+    into Python bytes objects: the file is mapped into memory and
+    the hasher consumes the kernel page cache directly. Empty files
+    (which mmap rejects) and platforms without a working mmap fall
+    back to a readinto loop over a reusable buffer"""
+    # buffering=0 skips Python's own buffer since we bring ours
+    with open(filepath, "rb", buffering=0) as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+                return
+        except (ValueError, OSError):
+            pass
+
+        buffer = bytearray(_HASH_CHUNK)
+        view = memoryview(buffer)
+        while n := f.readinto(view):
+            hasher.update(view[:n])
+
+
+def _hash_file(filepath: Union[str, os.PathLike]) -> bytes:
+    """Hash a single file and return its raw digest"""
+    hasher = _new_hasher()
+    _update_hash_from_file(hasher, filepath)
+    return hasher.digest()
+
+
+class ReportError(Exception):
+    """Base report error"""
+
+
+class MultipleClassUnderMutationError(Exception):
+    """Only a class under mutation at time can be analyzed
+    because of Jumble - working on a single class at time"""
+
+
+class MissingMutantCountException(ReportError):
+    """Exception when a mutant list count is missing,
+    This can happen if it's impossible to extract
+    information about that particular kind of
+     mutants from a report"""
+
+
+class OverlappingMutantsError(ReportError):
+    """Exception raised when there are two
+    or more mutants in a sequence that shares the same
+    hash key; because collisions are unlikely with SHA256,
+    this means that the Mutant interface needs a counter"""
+
+
+class JudyReportError(ReportError):
+    """Judy specialized report error"""
+
+
+class EmptyJudyReportError(JudyReportError):
+    """Error raised when a report is empty"""
+
+
+class MissingClassFromJudyReportError(JudyReportError):
+    """Exception when the desired class is
+    missing from a report"""
+
+
+class MultipleClassFromJudyReportError(JudyReportError):
+    """Error when the desired class is found
+    multiple times in a report"""
+
+
+class JumbleReportError(ReportError):
+    """Jumble specialized report error"""
+
+
+class MajorReportError(ReportError):
+    """Major specialized report error"""
+
+
+class PitReportError(ReportError):
+    """Pit specialized report error"""
+
+
+class WrongTagInPitReportError(PitReportError):
+    """Error raised when a non-mutation element is
+    encountered parsing an XML Pit report"""
+
+
+def _find_class_entry(classes: List[dict], name: str) -> dict:
+    """Find the entry of the desired class in the per-class
+    dicts of a Judy report; a single early-exiting pass asserts
+    it appears exactly once, without materializing a list"""
+    found = None
+    for adict in classes:
+        if adict["name"] == name:
+            if found is not None:
+                raise MultipleClassFromJudyReportError(
+                    f"{name} found multiple times!"
+                )
+            found = adict
+
+    if found is None:
+        raise MissingClassFromJudyReportError(f"{name} not found!")
+
+    return found
+
+
+class Report(ABC):
+    class_under_mutation: str
+
+    def __init__(self):
+        self._created_at = datetime.datetime.now()
+
+        self.killed_mutants: Optional[List[Mutant]] = None
+        self.live_mutants: Optional[List[Mutant]] = None
+        self._killed_mutants_count: Optional[int] = None
+        self._live_mutants_count: Optional[int] = None
+        self._hash_int: Optional[int] = None
+
+    def hash_string(self) -> str:
+        """Hash algorithm hex digest
+        converted to string"""
+        raise NotImplementedError
+
+    def __hash__(self) -> int:
+        """hash string value (hex) converted to int, to match
+        Python __hash__ return value; computed once and folded
+        into 63 bits so container lookups don't re-parse the hex
+        string or juggle a big integer"""
+        if self._hash_int is None:
+            self._hash_int = int(self.hash_string(), base=16) & ((1 << 63) - 1)
+        return self._hash_int
+
+    def summary(self, print_mutants: bool = False) -> str:
+        mutscore = self.killed_mutants_count / self.total_mutants_count
+        buffer = [
+            f"{self.__class__.__name__} Summary [Hash: {self.hash_string()}]",
+            f"Report created at:    {self._created_at}",
+            f"Mutated class:        {self.class_under_mutation}",
+            f"Total mutants count:  {self.total_mutants_count}",
+            f"Killed mutants count: {self.killed_mutants_count}",
+            f"Live mutants count:   {self.live_mutants_count}",
+            f"Mutation score:       {mutscore}",
+        ]
+
+        for mutants_arr, mutants_str in zip(
+            [self.killed_mutants, self.live_mutants], ["Killed", "Live"]
+        ):
+            if mutants_arr:
+                buffer.append(f"{mutants_str} mutants report:")
+                if print_mutants:
+                    buffer.append("\n".join(str(m) for m in mutants_arr))
+                else:
+                    buffer.append("< SNIP >")
+            else:
+                buffer.append(f"Cannot report {mutants_str} mutants")
+
+        return "\n".join(buffer)
+
+    @staticmethod
+    def find_overlapping_mutants(mutants: List[Mutant]) -> Set[Mutant]:
+        """This brief algorithm finds the mutants that are duplicates,
+        i.e. their hash value is equal."""
+        # mutant hashes are not free, compute them only once
+        hashes = [hash(mutant) for mutant in mutants]
+
+        if _find_duplicate_mask is not None and mutants:
+            # fold the sha256-sized hashes to 64 bits for the JIT
+            # kernel; a fold collision is as unlikely as a real one
+            folded = np.fromiter(
+                (h & 0xFFFFFFFFFFFFFFFF for h in hashes),
+                dtype=np.uint64,
+                count=len(hashes),
+            )
+            mask = _find_duplicate_mask(folded)
+            return {m for (m, dup) in zip(mutants, mask) if dup}
+
+        counter = Counter(hashes)
+        duplicates = {h for (h, c) in counter.items() if c > 1}
+        return {m for (m, h) in zip(mutants, hashes) if h in duplicates}
+
+    def sanity_check(self):
+        """Check for overlapping mutants"""
+        if self.killed_mutants:
+            set_killed = self.find_overlapping_mutants(self.killed_mutants)
+            if set_killed:
+                raise OverlappingMutantsError(set_killed)
+
+        if self.live_mutants:
+            set_live = self.find_overlapping_mutants(self.live_mutants)
+            if set_live:
+                raise OverlappingMutantsError(set_live)
+
+        if not self.class_under_mutation:
+            raise ReportError(
+                "Cannot set class under mutation! Maybe input report was broken?"
+            )
+
+    @property
+    def killed_mutants_count(self) -> int:
+        if self.killed_mutants is not None:
+            return len(self.killed_mutants)
+        elif self._killed_mutants_count is not None:
+            return self._killed_mutants_count
+        else:
+            raise MissingMutantCountException()
+
+    @property
+    def live_mutants_count(self) -> int:
+        if self.live_mutants is not None:
+            return len(self.live_mutants)
+        elif self._live_mutants_count is not None:
+            return self._live_mutants_count
+        else:
+            raise MissingMutantCountException()
+
+    @property
+    def total_mutants_count(self) -> int:
+        return self.killed_mutants_count + self.live_mutants_count
+
+    def __repr__(self):
+        return (
+            f"Report(class_under_mutation={self.class_under_mutation},"
+            f" killed_count={self.killed_mutants_count},"
+            f" live_count={self.live_mutants_count},"
+            f" total_count={self.total_mutants_count})"
+        )
+
+
+class SingleFileReport(Report):
+    def __init__(self, filepath: Union[str, os.PathLike]):
+        super(SingleFileReport, self).__init__()
+
+        self.filepath = pathlib.Path(filepath)
+        hasher = _new_hasher()
+        _update_hash_from_file(hasher, self.filepath)
+        self._hash_string = hasher.hexdigest()
+        try:
+            self.extract()
+        except Exception:
+            raise ReportError(ERR_EXTRACT.format(fp=self.filepath))
+
+        self.sanity_check()
+
+    def hash_string(self):
+        return self._hash_string
+
+    def extract(self, **kwargs):
+        raise NotImplementedError
+
+    def summary(self, print_mutants: bool = False) -> str:
+        summary = super(SingleFileReport, self).summary(print_mutants=print_mutants)
+        fp = str(self.filepath)
+        return f"{summary}\nFilepath: {fp}"
+
+
+class MultipleFilesReport(Report):
+    def __init__(self, *filepaths: Union[str, os.PathLike]):
+        super(MultipleFilesReport, self).__init__()
+
+        self.filepaths = [pathlib.Path(fp) for fp in filepaths]
+
+        # hash the files concurrently: the hashers release the GIL
+        # while digesting, so reads and compute overlap across files;
+        # the per-file digests combine into one stable hash string
+        workers = max(len(self.filepaths), 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = list(executor.map(_hash_file, self.filepaths))
+
+        hasher = _new_hasher()
+        hasher.update(b"\n".join(digests))
+        self._hash_string = hasher.hexdigest()
+        try:
+            self.extract()
+        except Exception:
+            raise ReportError(ERR_EXTRACT_MULT.format(fps=self.filepaths))
+
+        self.sanity_check()
+
+    def hash_string(self):
+        return self._hash_string
+
+    def extract(self, **kwargs):
+        raise NotImplementedError
+
+    def summary(self, print_mutants: bool = False) -> str:
+        summary = super(MultipleFilesReport, self).summary(print_mutants=print_mutants)
+        fps = [str(fp) for fp in self.filepaths]
+        return f"{summary}\nFilepaths: {fps}"
+
+
+class SingleJudyReport(SingleFileReport):
+    def __init__(
+        self,
+        json_filepath: Union[str, os.PathLike],
+        class_under_mutation: str,
+    ):
+        self.class_under_mutation = class_under_mutation
+        self.json_fp = pathlib.Path(json_filepath)
+        super(SingleJudyReport, self).__init__(json_filepath)
+
+    def __repr__(self):
+        return "SingleJudy" + super(SingleJudyReport, self).__repr__()
+
+    def _extract_json(self):
+        """Parse live mutants from json report"""
+        with open(self.json_fp, "rb") as f:
+            judy_dict = _json_loads(f.read())
+
+        classes = judy_dict["classes"]
+        if not classes:
+            raise EmptyJudyReportError(
+                "No mutated class found! There were some errors in execution phase"
+            )
+
+        thedict = _find_class_entry(classes, self.class_under_mutation)
+
+        JudyMutant.reset_counter()
+        self._killed_mutants_count = thedict["mutantsKilledCount"]
+        self.live_mutants = [
+            JudyMutant.from_dict(mdict) for mdict in thedict["notKilledMutant"]
+        ]
+
+    def extract(self):
+        self._extract_json()
+
+
+class MultipleJudyReport(MultipleFilesReport):
+    def __init__(
+        self,
+        json_filepath: Union[str, os.PathLike],
+        log_filepath: Union[str, os.PathLike],
+        class_under_mutation: str,
+    ):
+        self.class_under_mutation = class_under_mutation
+        self.json_fp = pathlib.Path(json_filepath)
+        self.log_fp = pathlib.Path(log_filepath)
+        super(MultipleJudyReport, self).__init__(json_filepath, log_filepath)
+
+    def __repr__(self):
+        return "MultipleJudy" + super(MultipleJudyReport, self).__repr__()
+
+    def _extract_json(self):
+        """Parse live mutants from json report"""
+        with open(self.json_fp, "rb") as f:
+            judy_dict = _json_loads(f.read())
+
+        classes = judy_dict["classes"]
+        if not classes:
+            raise EmptyJudyReportError(
+                "No mutated class found! There were some errors in execution phase"
+            )
+
+        thedict = _find_class_entry(classes, self.class_under_mutation)
+
+        JudyMutant.reset_counter()
+        self._killed_mutants_count = thedict["mutantsKilledCount"]
+        self.live_mutants = [
+            JudyMutant.from_dict(mdict) for mdict in thedict["notKilledMutant"]
+        ]
+
+    def _extract_log(self):
+        """Extract killed mutants through log"""
+        # the parser is specialized on the class under mutation and
+        # cached across reports; it lazily iterates the file object
+        # and returns the deduplicated (points, mutant_id, operator,
+        # line) entries
+        parse = _make_judy_log_parser(self.class_under_mutation)
+        with open(self.log_fp) as f:
+            mutations = parse(f)
+
+        self.killed_mutants = [JudyMutant.from_tuple(t) for t in mutations]
+
+    def extract(self):
+        self._extract_json()
+        self._extract_log()
+
+
+class JumbleReport(SingleFileReport):
+    def __repr__(self):
+        return "Jumble" + super(JumbleReport, self).__repr__()
+
+    def extract(self):
+        # single streaming pass over the log instead of slurping it
+        # and re-scanning the same megabytes once per pattern
+        class_name = None
+        score_seen = False
+        in_body = False
+        body_seen = False
+        killed_mutants_count = 0
+        live_mutants_count = 0
+        fails = []
+
+        with open(self.filepath) as f:
+            for line in f:
+                if class_name is None:
+                    match = _JUMBLE_CLASS_RE.search(line)
+                    if match:
+                        class_name = match.group(1)
+
+                # check if there were some errors with Jumble
+                match = _JUMBLE_ERROR_RE.search(line)
+                if match:
+                    score_seen = True
+                    errmsg = match.group(1)
+                    if errmsg:
+                        raise JumbleReportError(errmsg)
+
+                if not in_body and not body_seen:
+                    match = _JUMBLE_START_RE.search(line)
+                    if not match:
+                        continue
+                    in_body = True
+                    line = line[match.end():]
+
+                if in_body:
+                    match = _JUMBLE_END_RE.search(line)
+                    if match:
+                        line = line[: match.start()]
+                        in_body = False
+                        body_seen = True
+
+                    # subtract from the line all the fails + count them,
+                    # the leftover non-whitespace marks are killed mutants
+                    line_fails = _JUMBLE_FAIL_RE.findall(line)
+                    if line_fails:
+                        fails.extend(line_fails)
+                        line, count = _JUMBLE_FAIL_RE.subn("", line)
+                        live_mutants_count += count
+                    killed_mutants_count += len(_WHITESPACE_RE.sub("", line))
+
+        if class_name is None or not score_seen or not body_seen:
+            raise JumbleReportError(
+                "Broken Jumble report: missing class, score or mutation section"
+            )
+
+        self.class_under_mutation = class_name
+
+        JumbleMutant.reset_counter()
+        self._killed_mutants_count = killed_mutants_count
+        self.live_mutants = [JumbleMutant.from_tuple(atuple) for atuple in fails]
+        assert self.live_mutants_count == live_mutants_count
+
+
+class MajorReport(MultipleFilesReport):
+    def __init__(
+        self,
+        mutation_log_fp: Union[str, os.PathLike],
+        kill_csv_fp: Union[str, os.PathLike],
+    ):
+        self.mutation_log_fp = mutation_log_fp
+        self.kill_csv_fp = kill_csv_fp
+        super(MajorReport, self).__init__(mutation_log_fp, kill_csv_fp)
+
+    def __repr__(self):
+        return "Major" + super(MajorReport, self).__repr__()
+
+    def extract(self):
+        if len(self.filepaths) != 2:
+            raise MajorReportError(
+                "Two files must be provided! kill.csv and mutants.log"
+            )
+
+        logfile, csvfile = self.mutation_log_fp, self.kill_csv_fp
+
+        columns = ["MutantNo", "Status"]
+        kill_df = pd.read_csv(
+            csvfile,
+            header=0,
+            names=columns,
+            engine="c",
+            dtype={"Status": "category"},
+        ).set_index(columns[0])
+
+        columns = [
+            "MutantNo",
+            "Operator",
+            "From",
+            "To",
+            "Signature",
+            "LineNumber",
+            "LineBuffer",
+            "Description",
+        ]
+        # explicit dtypes skip type inference; categories collapse
+        # the handful of repeated operator/operand strings to codes
+        mutants_df = pd.read_csv(
+            logfile,
+            delimiter=":",
+            header=None,
+            names=columns,
+            on_bad_lines='skip',
+            engine="c",
+            dtype={
+                "Operator": "category",
+                "From": "category",
+                "To": "category",
+                "Signature": "string",
+                "LineNumber": "int32",
+                "LineBuffer": "string",
+                "Description": "string",
+            },
+        ).set_index(columns[0])
+
+        # fix mismatch in length
+        if kill_df.empty or len(kill_df) == 0:
+            # empty kill csv -> all mutants are live
+            kill_df = pd.DataFrame(["LIVE"] * len(mutants_df), columns=["Status"])
+            kill_df.index.name = "MutantNo"
+
+        print(f"Kill dataframe:\n{kill_df}")
+        print(f"Mutants dataframe:\n{mutants_df}")
+
+        df = mutants_df.join(kill_df)
+        print(f"Mutants dataframe:\n{df}")
+        live_mask = df.Status == "LIVE"
+        live_mutants = df.loc[live_mask]
+        print(f"Live mutants dataframe:\n{live_mutants}")
+        killed_mutants = df.loc[~live_mask]
+        print(f"Killed mutants dataframe:\n{killed_mutants}")
+        live_count = len(live_mutants)
+        print(f"Live mutants count: {live_count}")
+        killed_count = len(killed_mutants)
+        print(f"Killed mutants count: {killed_count}")
+        assert len(df) == live_count + killed_count
+
+        # class extraction: get the left part of class@method, then
+        # the left part of class$subclass; partition stops at the
+        # first separator without allocating a list, and interning
+        # makes the repeated class strings share a single object
+        signatures = df["Signature"].astype(str)
+        classes = signatures.map(
+            lambda sig: sys.intern(sig.partition("@")[0].partition("$")[0])
+        )
+        unique_classes = classes.unique()
+        if unique_classes.size > 1:
+            raise MultipleClassUnderMutationError("Multiple classes mutated!")
+
+        # itertuples avoids materializing a Series per row
+        MajorMutant.reset_counter()
+        self.live_mutants = [
+            MajorMutant.from_tuple(atuple)
+            for atuple in live_mutants.itertuples(index=True, name=None)
+        ]
+        self.killed_mutants = [
+            MajorMutant.from_tuple(atuple)
+            for atuple in killed_mutants.itertuples(index=True, name=None)
+        ]
+        self.class_under_mutation = unique_classes[0]
+
+
+class PitReport(SingleFileReport):
+    def __repr__(self):
+        return "Pit" + super(PitReport, self).__repr__()
+
+    def extract(self):
+        self.live_mutants = []
+        self.killed_mutants = []
+
+        # uniqueness of the mutated class is tracked incrementally
+        # against the first one seen: one compare per mutant instead
+        # of a set holding thousands of identical strings
+        self.class_under_mutation = None
+
+        if lxml_etree is not None:
+            self._extract_lxml()
+        else:
+            self._extract_stdlib()
+
+    def _collect_mutant(self, element):
+        mutant = PitMutant.from_xml_element(element)
+        if self.class_under_mutation is None:
+            self.class_under_mutation = mutant.mutated_class
+        elif mutant.mutated_class != self.class_under_mutation:
+            raise MultipleClassUnderMutationError("Multiple classes mutated!")
+
+        if mutant.detected:
+            self.killed_mutants.append(mutant)
+        else:
+            self.live_mutants.append(mutant)
+
+    def _extract_lxml(self):
+        """Fast path: libxml2 walks the file and only 'mutation'
+        elements ever surface to Python"""
+        context = lxml_etree.iterparse(
+            str(self.filepath), tag="mutation", events=("end",)
+        )
+        for _, element in context:
+            self._collect_mutant(element)
+            # classic lxml cleanup: drop the element content and the
+            # exhausted preceding siblings the root keeps references to
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _extract_stdlib(self):
+        """Fallback path: stream the XML with the stdlib parser,
+        only the mutation element currently parsed is kept alive;
+        the depth counter tells apart root children from their
+        own subtrees"""
+        depth = 0
+        for event, element in ET.iterparse(self.filepath, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:  # not a direct child of the root
+                continue
+
+            if element.tag != "mutation":
+                msg = f"Expecting 'mutation' element, got {element.tag}"
+                raise WrongTagInPitReportError(msg)
+
+            self._collect_mutant(element)
+            element.clear()